@@ -0,0 +1,41 @@
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+UPLOAD_DIR = os.environ.get("EPUB_UPLOAD_DIR", os.path.join(BASE_DIR, "uploads"))
+OUTPUT_DIR = os.environ.get("EPUB_OUTPUT_DIR", os.path.join(BASE_DIR, "outputs"))
+
+OLLAMA_BASE_URL = os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434")
+
+# "bs4" (BeautifulSoup) or "lxml" (see LxmlEPUBParser)
+PARSER_BACKEND = os.environ.get("EPUB_PARSER_BACKEND", "bs4")
+
+# Characters of the previous chunk's translation sent along with each chunk
+# for consistency. 0 disables the rolling context.
+CONTEXT_CHARS = int(os.environ.get("EPUB_CONTEXT_CHARS", "0"))
+
+# "local" runs translation inside the API process, "distributed" hands
+# chunks to `python -m app.worker` processes through the work queue.
+EXECUTION_MODE = os.environ.get("EPUB_EXECUTION_MODE", "local")
+
+# Directory holding the SQLite work queue. Workers on other hosts must
+# point at the same directory (e.g. a shared mount).
+QUEUE_DIR = os.environ.get("EPUB_QUEUE_DIR", os.path.join(BASE_DIR, "queue"))
+QUEUE_PATH = os.path.join(QUEUE_DIR, "queue.db")
+
+# Models stay loaded this long after the last job using them finishes.
+# Requests ask Ollama to keep the model a little longer than that so the
+# manager's explicit unload always wins, and Ollama still cleans up on its
+# own if the backend goes away.
+MODEL_IDLE_UNLOAD_SECONDS = float(os.environ.get("EPUB_MODEL_IDLE_UNLOAD", "300"))
+MODEL_KEEP_ALIVE = int(MODEL_IDLE_UNLOAD_SECONDS) + 60
+
+# Retention of finished jobs and their files. Finished jobs and uploads are
+# deleted once unused for their TTL, least recently used first when the
+# quota (0 = unlimited) is exceeded.
+JOB_TTL_SECONDS = float(os.environ.get("EPUB_JOB_TTL", str(24 * 3600)))
+UPLOAD_TTL_SECONDS = float(os.environ.get("EPUB_UPLOAD_TTL", str(24 * 3600)))
+STORAGE_QUOTA_BYTES = int(
+    float(os.environ.get("EPUB_STORAGE_QUOTA_MB", "0")) * 1024 * 1024
+)
+JANITOR_INTERVAL_SECONDS = float(os.environ.get("EPUB_JANITOR_INTERVAL", "60"))
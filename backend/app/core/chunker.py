@@ -1,14 +1,20 @@
-from typing import List
+from typing import Iterator, List
 from dataclasses import dataclass
 
 from .epub_parser import TranslatableElement
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationChunk:
     chunk_id: int
     elements: List[TranslatableElement]
-    combined_text: str
+
+    @property
+    def combined_text(self) -> str:
+        """Element texts joined with index delimiters, built on demand."""
+        return "\n\n".join(
+            f"[{i}] {elem.text}" for i, elem in enumerate(self.elements)
+        )
 
 
 class TextChunker:
@@ -26,55 +32,43 @@ class TextChunker:
         Group elements into chunks that fit within the character limit.
         Each element is kept intact - we don't split individual paragraphs.
         """
-        chunks = []
-        current_elements = []
+        return [
+            TranslationChunk(chunk_id=chunk_id, elements=elements[start:end])
+            for chunk_id, (start, end) in enumerate(self._chunk_bounds(elements))
+        ]
+
+    def count_chunks(self, elements: List[TranslatableElement]) -> int:
+        """Number of chunks chunk_elements() would produce, without building them."""
+        return sum(1 for _ in self._chunk_bounds(elements))
+
+    def _chunk_bounds(
+        self, elements: List[TranslatableElement]
+    ) -> Iterator[tuple[int, int]]:
+        """Yield (start, end) element index ranges of each chunk."""
+        start = 0
         current_length = 0
-        chunk_id = 0
 
-        for element in elements:
+        for i, element in enumerate(elements):
             element_length = len(element.text)
 
             if element_length > self.max_chars:
-                if current_elements:
-                    chunks.append(self._create_chunk(chunk_id, current_elements))
-                    chunk_id += 1
-                    current_elements = []
-                    current_length = 0
-
-                chunks.append(self._create_chunk(chunk_id, [element]))
-                chunk_id += 1
+                if i > start:
+                    yield start, i
+                yield i, i + 1
+                start = i + 1
+                current_length = 0
                 continue
 
             if current_length + element_length > self.max_chars:
-                if current_elements:
-                    chunks.append(self._create_chunk(chunk_id, current_elements))
-                    chunk_id += 1
-                current_elements = [element]
+                if i > start:
+                    yield start, i
+                start = i
                 current_length = element_length
             else:
-                current_elements.append(element)
                 current_length += element_length
 
-        if current_elements:
-            chunks.append(self._create_chunk(chunk_id, current_elements))
-
-        return chunks
-
-    def _create_chunk(
-        self, chunk_id: int, elements: List[TranslatableElement]
-    ) -> TranslationChunk:
-        """Create a chunk with combined text using delimiters."""
-        texts = []
-        for i, elem in enumerate(elements):
-            texts.append(f"[{i}] {elem.text}")
-
-        combined = "\n\n".join(texts)
-
-        return TranslationChunk(
-            chunk_id=chunk_id,
-            elements=elements,
-            combined_text=combined,
-        )
+        if start < len(elements):
+            yield start, len(elements)
 
     def parse_translated_chunk(
         self, chunk: TranslationChunk, translated_text: str
@@ -1,18 +1,42 @@
-import ebooklib
-from ebooklib import epub
-from bs4 import BeautifulSoup
-from typing import List, Tuple
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING, Iterator, List
 from dataclasses import dataclass
 
+from ..config import PARSER_BACKEND
+
+# ebooklib, BeautifulSoup and lxml are imported where they are used so that
+# importing the app does not pay for them until a book is parsed.
+if TYPE_CHECKING:
+    from ebooklib import epub
+
 
-@dataclass
+TRANSLATABLE_TAGS = [
+    "p",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "li",
+    "td",
+    "th",
+    "figcaption",
+    "blockquote",
+    "title",
+]
+
+
+@dataclass(slots=True)
 class TranslatableElement:
     element_id: str
     text: str
     tag_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Chapter:
     index: int
     name: str
@@ -22,61 +46,58 @@ class Chapter:
 
 class EPUBParser:
     def __init__(self, file_path: str):
+        from ebooklib import epub
+
         self.file_path = file_path
         # ignore_ncx=False to avoid lxml parsing issues with HTML comments in nav
         self.book = epub.read_epub(file_path, options={"ignore_ncx": False})
 
-    def get_chapters(self) -> List[Chapter]:
-        """Extract all document items (chapters) from EPUB."""
-        chapters = []
-        items = list(self.book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
+    def iter_chapters(self, annotate: bool = True) -> Iterator[Chapter]:
+        """
+        Lazily extract document items (chapters) from EPUB, one at a time.
+        With annotate=False the chapter content is left untouched, which is
+        cheaper for read-only passes; such chapters cannot be passed to
+        apply_translations().
+        """
+        import ebooklib
 
         chapter_index = 0
-        for item in items:
-            elements = self._extract_translatable_elements(item)
+        for item in self.book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
+            elements = self._extract_translatable_elements(item, annotate)
             if elements:
-                chapter = Chapter(
+                yield Chapter(
                     index=chapter_index,
                     name=item.get_name() or f"Chapter {chapter_index + 1}",
                     item=item,
                     elements=elements,
                 )
-                chapters.append(chapter)
                 chapter_index += 1
 
-        return chapters
+    def get_chapters(self) -> List[Chapter]:
+        """Extract all document items (chapters) from EPUB."""
+        return list(self.iter_chapters())
 
     def _extract_translatable_elements(
-        self, item: epub.EpubHtml
+        self, item: epub.EpubHtml, annotate: bool = True
     ) -> List[TranslatableElement]:
-        """Extract text elements that need translation."""
+        """
+        Extract text elements that need translation. When annotating, each
+        element is tagged with its id and the chapter content re-serialized.
+        """
+        from bs4 import BeautifulSoup
+
         content = item.get_content()
         soup = BeautifulSoup(content, "lxml")
 
-        translatable_tags = [
-            "p",
-            "h1",
-            "h2",
-            "h3",
-            "h4",
-            "h5",
-            "h6",
-            "li",
-            "td",
-            "th",
-            "figcaption",
-            "blockquote",
-            "title",
-        ]
-
         elements = []
         element_counter = 0
 
-        for tag in soup.find_all(translatable_tags):
+        for tag in soup.find_all(TRANSLATABLE_TAGS):
             text = tag.get_text(strip=True)
             if text and len(text) > 1:
                 element_id = f"elem_{element_counter}"
-                tag["data-translate-id"] = element_id
+                if annotate:
+                    tag["data-translate-id"] = element_id
                 elements.append(
                     TranslatableElement(
                         element_id=element_id,
@@ -86,13 +107,16 @@ class EPUBParser:
                 )
                 element_counter += 1
 
-        item.set_content(str(soup).encode("utf-8"))
+        if annotate:
+            item.set_content(str(soup).encode("utf-8"))
         return elements
 
     def apply_translations(
         self, item: epub.EpubHtml, translations: dict[str, str]
     ) -> None:
         """Apply translations to a chapter item."""
+        from bs4 import BeautifulSoup
+
         content = item.get_content()
         soup = BeautifulSoup(content, "lxml")
 
@@ -114,4 +138,127 @@ class EPUBParser:
 
     def save(self, output_path: str) -> None:
         """Save the translated EPUB."""
+        from ebooklib import epub
+
         epub.write_epub(output_path, self.book)
+
+
+@cache
+def _element_text_nodes():
+    """
+    XPath selecting text nodes as seen by BeautifulSoup's get_text():
+    comments are not text nodes, and script/style contents are skipped.
+    """
+    from lxml import etree
+
+    return etree.XPath(".//text()[not(parent::script) and not(parent::style)]")
+
+
+class LxmlEPUBParser(EPUBParser):
+    """
+    Parser backend working on lxml trees directly.
+
+    Elements are located by their ordinal among translatable elements in
+    document order, so extraction leaves the chapter content untouched and
+    each chapter is parsed once for extraction and once for apply, without
+    the data-translate-id attributes and re-serialization of the
+    BeautifulSoup backend. Only <body> is scanned: ebooklib rebuilds <head>
+    from item metadata when writing, so head text never reaches the output.
+    """
+
+    def _parse_item(self, item: epub.EpubHtml):
+        """Parse the raw chapter content, returning the element to scan."""
+        from lxml import etree, html
+
+        content = item.content
+        if not content:
+            return None, None
+        try:
+            root = html.document_fromstring(
+                content, parser=html.HTMLParser(encoding="utf-8")
+            )
+        except etree.ParserError:
+            return None, None
+        body = root.find("body")
+        return root, body if body is not None else root
+
+    def _iter_translatable(self, container):
+        """Yield (ordinal, element, text) for each translatable element."""
+        text_nodes = _element_text_nodes()
+        ordinal = 0
+        for tag in container.iter(*TRANSLATABLE_TAGS):
+            text = "".join(t.strip() for t in text_nodes(tag))
+            if text and len(text) > 1:
+                yield ordinal, tag, text
+                ordinal += 1
+
+    def _extract_translatable_elements(
+        self, item: epub.EpubHtml, annotate: bool = True
+    ) -> List[TranslatableElement]:
+        """Extract text elements that need translation; never modifies item."""
+        _, container = self._parse_item(item)
+        if container is None:
+            return []
+
+        return [
+            TranslatableElement(
+                element_id=f"elem_{ordinal}",
+                text=text,
+                tag_name=tag.tag,
+            )
+            for ordinal, tag, text in self._iter_translatable(container)
+        ]
+
+    def apply_translations(
+        self, item: epub.EpubHtml, translations: dict[str, str]
+    ) -> None:
+        """Apply translations to a chapter item."""
+        from lxml import html
+
+        root, container = self._parse_item(item)
+        if container is None or not translations:
+            return
+
+        # Collect first: flattening an element removes its children, which
+        # would stop lxml's iterator if done while iterating
+        for ordinal, tag, _ in list(self._iter_translatable(container)):
+            translated_text = translations.get(f"elem_{ordinal}")
+            if translated_text is not None:
+                self._replace_text_content(tag, translated_text)
+
+        item.set_content(html.tostring(root, encoding="utf-8"))
+
+    def _replace_text_content(self, tag, new_text: str) -> None:
+        """
+        Replace text content while preserving inline tags as much as possible.
+        Mirrors BeautifulSoup's tag.string: descend through single-child
+        wrappers and replace the only text node, otherwise flatten.
+        """
+        node = tag
+        while len(node) == 1 and not (node.text or "") and not (node[0].tail or ""):
+            if not isinstance(node[0].tag, str):
+                break
+            node = node[0]
+
+        if len(node) == 0 and node.text:
+            node.text = new_text
+            return
+
+        for child in list(tag):
+            tag.remove(child)
+        tag.text = new_text
+
+
+PARSER_BACKENDS = {
+    "bs4": EPUBParser,
+    "lxml": LxmlEPUBParser,
+}
+
+
+def create_parser(file_path: str, backend: str = PARSER_BACKEND) -> EPUBParser:
+    """Create an EPUB parser using the configured backend."""
+    try:
+        parser_class = PARSER_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown parser backend: {backend}")
+    return parser_class(file_path)
@@ -0,0 +1,251 @@
+import asyncio
+import os
+import time
+from typing import Dict
+
+from .translator import TranslationJob
+from ..config import (
+    JANITOR_INTERVAL_SECONDS,
+    JOB_TTL_SECONDS,
+    STORAGE_QUOTA_BYTES,
+    UPLOAD_TTL_SECONDS,
+)
+from ..models.schemas import TranslationStatus
+
+
+FINISHED_STATUSES = {
+    TranslationStatus.COMPLETED,
+    TranslationStatus.FAILED,
+    TranslationStatus.CANCELLED,
+}
+
+# A download that never reported completion (e.g. the client went away
+# mid-transfer) stops protecting its file after this long.
+DOWNLOAD_GRACE_SECONDS = 3600.0
+
+
+class StorageJanitor:
+    """
+    Evicts finished jobs, their outputs and unused uploads.
+
+    Jobs and uploads unused for longer than their TTL are removed, and when
+    the uploads and outputs together exceed the quota the least recently
+    used ones go first. Jobs still running, their uploads and files being
+    downloaded are never touched.
+    """
+
+    def __init__(
+        self,
+        jobs: Dict[str, TranslationJob],
+        upload_dir: str,
+        output_dir: str,
+        job_ttl: float = JOB_TTL_SECONDS,
+        upload_ttl: float = UPLOAD_TTL_SECONDS,
+        quota_bytes: int = STORAGE_QUOTA_BYTES,
+        interval: float = JANITOR_INTERVAL_SECONDS,
+    ):
+        self.jobs = jobs
+        self.upload_dir = upload_dir
+        self.output_dir = output_dir
+        self.job_ttl = job_ttl
+        self.upload_ttl = upload_ttl
+        self.quota_bytes = quota_bytes
+        self.interval = interval
+
+        self._last_access: Dict[str, float] = {}
+        self._downloads: Dict[str, int] = {}
+        self._download_started: Dict[str, float] = {}
+
+    def touch(self, job_id: str) -> None:
+        """Mark a job as recently used."""
+        self._last_access[job_id] = time.time()
+
+    def touch_upload(self, file_id: str) -> None:
+        """Mark an uploaded file as recently used."""
+        path = self._upload_path(file_id)
+        if os.path.exists(path):
+            os.utime(path)
+
+    def start_download(self, job_id: str) -> None:
+        self.touch(job_id)
+        self._downloads[job_id] = self._downloads.get(job_id, 0) + 1
+        self._download_started[job_id] = time.time()
+
+    def finish_download(self, job_id: str) -> None:
+        count = self._downloads.get(job_id, 0) - 1
+        if count > 0:
+            self._downloads[job_id] = count
+        else:
+            self._downloads.pop(job_id, None)
+            self._download_started.pop(job_id, None)
+
+    def _is_downloading(self, job_id: str, now: float) -> bool:
+        started = self._download_started.get(job_id)
+        return (
+            started is not None
+            and self._downloads.get(job_id, 0) > 0
+            and now - started < DOWNLOAD_GRACE_SECONDS
+        )
+
+    def _upload_path(self, file_id: str) -> str:
+        return os.path.join(self.upload_dir, f"{file_id}.epub")
+
+    def _last_used(self, job: TranslationJob) -> float:
+        return max(
+            job.finished_at or 0.0,
+            self._last_access.get(job.job_id, 0.0),
+        )
+
+    def _scan(self, directory: str) -> Dict[str, os.stat_result]:
+        """Regular files in a directory with their stat results."""
+        if not os.path.isdir(directory):
+            return {}
+        return {
+            entry.path: entry.stat()
+            for entry in os.scandir(directory)
+            if entry.is_file()
+        }
+
+    def _remove(self, path: str) -> int:
+        """Delete a file, returning the bytes freed."""
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+            return size
+        except OSError:
+            return 0
+
+    def _evict_job(self, job: TranslationJob) -> int:
+        self.jobs.pop(job.job_id, None)
+        self._last_access.pop(job.job_id, None)
+        # Only downloads past the grace period reach here; their completion
+        # callback may never run
+        self._downloads.pop(job.job_id, None)
+        self._download_started.pop(job.job_id, None)
+        if job.output_path:
+            return self._remove(job.output_path)
+        return 0
+
+    def collect(self) -> dict:
+        """Run one eviction pass. Returns what was removed."""
+        now = time.time()
+        removed = {"jobs": 0, "uploads": 0, "outputs": 0, "bytes": 0}
+
+        finished = [
+            job
+            for job in self.jobs.values()
+            if job.status in FINISHED_STATUSES
+            and not self._is_downloading(job.job_id, now)
+        ]
+        in_use_uploads = {
+            self._upload_path(job.file_id)
+            for job in self.jobs.values()
+            if job.status not in FINISHED_STATUSES
+        }
+        known_outputs = {job.output_path for job in self.jobs.values()}
+
+        # Expired jobs
+        for job in finished:
+            if now - self._last_used(job) > self.job_ttl:
+                freed = self._evict_job(job)
+                removed["jobs"] += 1
+                removed["outputs"] += 1 if freed else 0
+                removed["bytes"] += freed
+
+        # Outputs left behind by a previous run of the server
+        for path, stat in self._scan(self.output_dir).items():
+            if path not in known_outputs and now - stat.st_mtime > self.job_ttl:
+                removed["bytes"] += self._remove(path)
+                removed["outputs"] += 1
+
+        # Expired uploads
+        uploads = self._scan(self.upload_dir)
+        for path, stat in list(uploads.items()):
+            if path not in in_use_uploads and now - stat.st_mtime > self.upload_ttl:
+                removed["bytes"] += self._remove(path)
+                removed["uploads"] += 1
+                del uploads[path]
+
+        if self.quota_bytes:
+            self._enforce_quota(now, removed, uploads, in_use_uploads)
+
+        return removed
+
+    def _enforce_quota(
+        self,
+        now: float,
+        removed: dict,
+        uploads: Dict[str, os.stat_result],
+        in_use_uploads: set,
+    ) -> None:
+        """Evict least recently used jobs and uploads until under quota."""
+        total = self.usage()["total_bytes"]
+        if total <= self.quota_bytes:
+            return
+
+        # (last used, kind, key) for everything that may be evicted
+        candidates = [
+            (self._last_used(job), "job", job.job_id)
+            for job in self.jobs.values()
+            if job.status in FINISHED_STATUSES
+            and not self._is_downloading(job.job_id, now)
+        ]
+        candidates += [
+            (stat.st_mtime, "upload", path)
+            for path, stat in uploads.items()
+            if path not in in_use_uploads
+        ]
+        candidates.sort()
+
+        for _, kind, key in candidates:
+            if total <= self.quota_bytes:
+                break
+            if kind == "job":
+                job = self.jobs.get(key)
+                if job is None:
+                    continue
+                freed = self._evict_job(job)
+                removed["jobs"] += 1
+                removed["outputs"] += 1 if freed else 0
+            else:
+                freed = self._remove(key)
+                removed["uploads"] += 1
+            removed["bytes"] += freed
+            total -= freed
+
+    def usage(self) -> dict:
+        """Current disk and job usage."""
+        uploads = self._scan(self.upload_dir)
+        outputs = self._scan(self.output_dir)
+        upload_bytes = sum(stat.st_size for stat in uploads.values())
+        output_bytes = sum(stat.st_size for stat in outputs.values())
+
+        now = time.time()
+        jobs_by_status: Dict[str, int] = {}
+        for job in self.jobs.values():
+            status = job.status.value
+            jobs_by_status[status] = jobs_by_status.get(status, 0) + 1
+
+        return {
+            "uploads": {"files": len(uploads), "bytes": upload_bytes},
+            "outputs": {"files": len(outputs), "bytes": output_bytes},
+            "total_bytes": upload_bytes + output_bytes,
+            "quota_bytes": self.quota_bytes,
+            "jobs": {"total": len(self.jobs), "by_status": jobs_by_status},
+            "active_downloads": sum(
+                count
+                for job_id, count in self._downloads.items()
+                if self._is_downloading(job_id, now)
+            ),
+            "job_ttl": self.job_ttl,
+            "upload_ttl": self.upload_ttl,
+        }
+
+    async def run(self) -> None:
+        """Collect periodically until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.collect()
+            except Exception:
+                pass
@@ -0,0 +1,59 @@
+import asyncio
+import os
+import sys
+import time
+from collections import deque
+
+
+def current_rss_bytes() -> int | None:
+    """
+    Resident set size of this process (peak RSS where /proc is missing),
+    or None where neither is available, e.g. on Windows.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class LoopLagMonitor:
+    """
+    Measures event loop lag: how late a periodic sleep wakes up.
+    Lag means something is blocking the loop (parsing, file I/O, ...).
+    """
+
+    def __init__(self, interval: float = 0.1, window: int = 600):
+        self.interval = interval
+        self._lags: deque[float] = deque(maxlen=window)
+        self._max_since_snapshot = 0.0
+
+    async def run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(time.perf_counter() - start - self.interval, 0.0)
+            self._lags.append(lag)
+            self._max_since_snapshot = max(self._max_since_snapshot, lag)
+
+    def snapshot(self) -> dict:
+        """Lag stats in ms over the recent window; the max resets on each call."""
+        lags = sorted(self._lags)
+        p99_index = min(int(len(lags) * 0.99), len(lags) - 1)
+        max_lag = self._max_since_snapshot
+        self._max_since_snapshot = 0.0
+        if not lags:
+            return {"mean_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        return {
+            "mean_ms": round(sum(lags) / len(lags) * 1000, 2),
+            "p99_ms": round(lags[p99_index] * 1000, 2),
+            "max_ms": round(max_lag * 1000, 2),
+        }
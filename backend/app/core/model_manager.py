@@ -0,0 +1,145 @@
+import asyncio
+import time
+from typing import Dict
+
+from .ollama_client import OllamaClient
+from ..config import MODEL_IDLE_UNLOAD_SECONDS, MODEL_KEEP_ALIVE
+
+
+class ModelManager:
+    """
+    Keeps Ollama models resident across jobs.
+
+    Jobs acquire a model when they start, which warms it up in the
+    background, and release it when they finish. A model is unloaded only
+    after no job has held it for `idle_unload_seconds`.
+    """
+
+    def __init__(
+        self,
+        idle_unload_seconds: float = MODEL_IDLE_UNLOAD_SECONDS,
+        keep_alive: int = MODEL_KEEP_ALIVE,
+    ):
+        self.idle_unload_seconds = idle_unload_seconds
+        self.keep_alive = keep_alive
+        self.ollama: OllamaClient | None = None
+        self._refs: Dict[str, int] = {}
+        self._loads: Dict[str, asyncio.Task] = {}
+        self._unload_timers: Dict[str, asyncio.Task] = {}
+        self._unloads: Dict[str, asyncio.Task] = {}
+
+    def _client(self) -> OllamaClient:
+        if self.ollama is None:
+            self.ollama = OllamaClient()
+        return self.ollama
+
+    def acquire(self, model: str) -> "asyncio.Future[float | None]":
+        """
+        Take a reference on a model and make sure it is loading.
+        Returns a future resolving to the seconds spent loading it, 0.0 if
+        Ollama reports it already resident, or None if the warm-up request
+        failed.
+        """
+        self._refs[model] = self._refs.get(model, 0) + 1
+
+        timer = self._unload_timers.pop(model, None)
+        if timer:
+            timer.cancel()
+
+        load = self._loads.get(model)
+        if load is None or load.done():
+            # A past load is only a hint: Ollama may have restarted or
+            # evicted the model since, so it is checked before being trusted
+            loaded_before = (
+                load is not None
+                and not load.cancelled()
+                and load.result() is not None
+            )
+            unload = self._unloads.get(model)
+            load = asyncio.create_task(self._load(model, unload, loaded_before))
+            self._loads[model] = load
+
+        # Shielded so a cancelled job does not abort a load other jobs share
+        return asyncio.shield(load)
+
+    def release(self, model: str) -> None:
+        """Drop a reference; the model is unloaded once idle for long enough."""
+        refs = self._refs.get(model, 0) - 1
+        if refs > 0:
+            self._refs[model] = refs
+            return
+
+        self._refs.pop(model, None)
+        if model not in self._unload_timers:
+            self._unload_timers[model] = asyncio.create_task(
+                self._unload_when_idle(model)
+            )
+
+    def active_models(self) -> Dict[str, int]:
+        """Models currently held by jobs, with their reference counts."""
+        return dict(self._refs)
+
+    async def _load(
+        self,
+        model: str,
+        unload: asyncio.Task | None = None,
+        loaded_before: bool = False,
+    ) -> float | None:
+        if unload is not None:
+            # Reloading while the keep_alive=0 request is still in flight could
+            # let the unload land last and evict the model we just loaded
+            await asyncio.shield(unload)
+
+        if loaded_before and await self._is_resident(model):
+            return 0.0
+
+        start = time.perf_counter()
+        try:
+            await self._client().load_model(model, keep_alive=self.keep_alive)
+        except Exception:
+            return None
+        return time.perf_counter() - start
+
+    async def _is_resident(self, model: str) -> bool:
+        try:
+            running = await self._client().running_models()
+        except Exception:
+            return False
+        # Ollama reports untagged models with their implicit :latest tag
+        return model in running or f"{model}:latest" in running
+
+    async def _unload_when_idle(self, model: str) -> None:
+        await asyncio.sleep(self.idle_unload_seconds)
+        self._unload_timers.pop(model, None)
+        if self._refs.get(model):
+            return
+
+        # From here on acquire() no longer cancels this task; loads wait for it
+        task = asyncio.current_task()
+        self._unloads[model] = task
+        try:
+            load = self._loads.pop(model, None)
+            if load and not load.done():
+                load.cancel()
+            await self._client().unload_model(model)
+        finally:
+            if self._unloads.get(model) is task:
+                del self._unloads[model]
+
+    async def close(self) -> None:
+        """Cancel pending work and close the Ollama client."""
+        for task in [
+            *self._loads.values(),
+            *self._unload_timers.values(),
+            *self._unloads.values(),
+        ]:
+            task.cancel()
+        self._loads.clear()
+        self._unload_timers.clear()
+        self._unloads.clear()
+        if self.ollama:
+            await self.ollama.close()
+            self.ollama = None
+
+
+model_manager = ModelManager()
@@ -1,13 +1,69 @@
+from __future__ import annotations
+
 import asyncio
-import httpx
-from typing import Optional
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from .prompts import build_system_prompt, build_user_prompt
+from ..config import OLLAMA_BASE_URL
+
+if TYPE_CHECKING:
+    import httpx
+
+
+@dataclass
+class GenerationStats:
+    """Timings reported by Ollama, summed over generate calls (ns)."""
+
+    calls: int = 0
+    load_duration: int = 0
+    prompt_eval_count: int = 0
+    prompt_eval_duration: int = 0
+    eval_count: int = 0
+    eval_duration: int = 0
+    total_duration: int = 0
+
+    def add(self, data: dict) -> None:
+        self.calls += 1
+        self.load_duration += data.get("load_duration", 0)
+        self.prompt_eval_count += data.get("prompt_eval_count", 0)
+        self.prompt_eval_duration += data.get("prompt_eval_duration", 0)
+        self.eval_count += data.get("eval_count", 0)
+        self.eval_duration += data.get("eval_duration", 0)
+        self.total_duration += data.get("total_duration", 0)
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Generation speed, excluding prompt evaluation."""
+        if not self.eval_duration:
+            return 0.0
+        return self.eval_count / (self.eval_duration / 1e9)
+
+    @property
+    def compute_seconds(self) -> float:
+        """
+        Time Ollama spent evaluating these requests, excluding model loads
+        and time queued behind other requests.
+        """
+        compute = self.prompt_eval_duration + self.eval_duration
+        if not compute:
+            compute = max(self.total_duration - self.load_duration, 0)
+        return compute / 1e9
 
 
 class OllamaClient:
-    def __init__(self, base_url: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        base_url: str = OLLAMA_BASE_URL,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        # Imported here so the app starts without loading httpx
+        import httpx
+
         self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=300.0)
+        self.client = httpx.AsyncClient(timeout=300.0, transport=transport)
         self._current_request: asyncio.Task | None = None
+        self.stats = GenerationStats()
 
     async def list_models(self) -> list[str]:
         """Get list of available models."""
@@ -23,39 +79,53 @@ class OllamaClient:
         target_lang: str,
         model: str,
         context: Optional[str] = None,
+        keep_alive: int | str | None = None,
+        system_prompt: Optional[str] = None,
     ) -> str:
         """Translate text using Ollama."""
-        system_prompt = f"""You are an expert literary translator specializing in {target_lang}.
-Translate the following text from {source_lang} to {target_lang}.
+        if system_prompt is None:
+            system_prompt = build_system_prompt(source_lang, target_lang)
+        user_prompt = build_user_prompt(text, context)
+
+        payload = {
+            "model": model,
+            "prompt": user_prompt,
+            "system": system_prompt,
+            "stream": False,
+            "options": {
+                "temperature": 0.3,
+                "top_p": 0.9,
+            },
+        }
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
 
-Guidelines:
-- Translate naturally so that native {target_lang} speakers can read it fluently.
-- Use idiomatic expressions and natural phrasing in {target_lang}, not literal word-for-word translation.
-- Preserve the original meaning, tone, and intent while adapting cultural references if needed.
-- Maintain paragraph structure and formatting.
-- Only output the translated text, nothing else.
-- Do not add explanations, notes, or translator comments."""
+        response = await self.client.post(
+            f"{self.base_url}/api/generate", json=payload
+        )
+        response.raise_for_status()
+        data = response.json()
+        self.stats.add(data)
+        return data.get("response", "").strip()
 
-        user_prompt = text
-        if context:
-            user_prompt = f"Context: {context}\n\nText to translate:\n{text}"
+    async def running_models(self) -> list[str]:
+        """Get the models currently loaded in memory."""
+        response = await self.client.get(f"{self.base_url}/api/ps")
+        response.raise_for_status()
+        data = response.json()
+        return [model["name"] for model in data.get("models", [])]
 
+    async def load_model(self, model: str, keep_alive: int | str) -> None:
+        """Load a model into memory without generating anything."""
         response = await self.client.post(
             f"{self.base_url}/api/generate",
             json={
                 "model": model,
-                "prompt": user_prompt,
-                "system": system_prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.3,
-                    "top_p": 0.9,
-                },
+                "prompt": "",
+                "keep_alive": keep_alive,
             },
         )
         response.raise_for_status()
-        data = response.json()
-        return data.get("response", "").strip()
 
     async def unload_model(self, model: str) -> bool:
         """Unload a model from memory by setting keep_alive to 0."""
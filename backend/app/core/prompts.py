@@ -0,0 +1,75 @@
+from typing import Dict, Optional
+
+
+def build_system_prompt(
+    source_lang: str,
+    target_lang: str,
+    glossary: Optional[Dict[str, str]] = None,
+) -> str:
+    """
+    Build the system prompt for a job.
+    The result only depends on the arguments, so every request of a job
+    starts with the same bytes and Ollama can reuse the evaluated prefix.
+    """
+    prompt = f"""You are an expert literary translator specializing in {target_lang}.
+Translate the following text from {source_lang} to {target_lang}.
+
+Guidelines:
+- Translate naturally so that native {target_lang} speakers can read it fluently.
+- Use idiomatic expressions and natural phrasing in {target_lang}, not literal word-for-word translation.
+- Preserve the original meaning, tone, and intent while adapting cultural references if needed.
+- Maintain paragraph structure and formatting.
+- Only output the translated text, nothing else.
+- Do not add explanations, notes, or translator comments."""
+
+    if glossary:
+        # Sorted so the prompt does not depend on dict ordering
+        terms = "\n".join(
+            f"- {source} → {target}" for source, target in sorted(glossary.items())
+        )
+        prompt += f"\n\nAlways translate these terms as follows:\n{terms}"
+
+    return prompt
+
+
+def build_user_prompt(text: str, context: Optional[str] = None) -> str:
+    """Build the per-chunk prompt, placed after the static system prompt."""
+    if not context:
+        return text
+    return (
+        "Previous passage, already translated (for consistency only, "
+        f"do not translate or repeat it):\n{context}\n\n"
+        f"Text to translate:\n{text}"
+    )
+
+
+class PromptBuilder:
+    """
+    Prompts for one job: a static system prompt plus an optional rolling
+    window with the tail of the previous chunk's translation.
+    """
+
+    def __init__(
+        self,
+        source_lang: str,
+        target_lang: str,
+        glossary: Optional[Dict[str, str]] = None,
+        context_chars: int = 0,
+    ):
+        self.system_prompt = build_system_prompt(source_lang, target_lang, glossary)
+        self.context_chars = context_chars
+        self.context: Optional[str] = None
+
+    def remember(self, translated_texts: list[str]) -> None:
+        """Keep the tail of the latest translation as context for the next chunk."""
+        if self.context_chars <= 0:
+            return
+
+        context = "\n\n".join(text for text in translated_texts if text)
+        if len(context) > self.context_chars:
+            context = context[-self.context_chars :]
+            # Start at a paragraph boundary when the window allows it
+            boundary = context.find("\n\n")
+            if boundary != -1:
+                context = context[boundary + 2 :]
+        self.context = context or None
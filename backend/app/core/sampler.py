@@ -0,0 +1,131 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+from .chunker import TextChunker
+from .epub_parser import EPUBParser
+from .model_manager import model_manager
+from .ollama_client import OllamaClient
+from .prompts import PromptBuilder
+
+
+# Opening and closing quotation marks across the supported languages
+DIALOGUE_MARKS = set("\"“”„«»「」『』")
+
+# Chunks shorter than this are not considered dialogue-heavy samples
+MIN_DIALOGUE_CHUNK_CHARS = 300
+
+
+@dataclass(slots=True)
+class SampleChunk:
+    kind: str  # "first", "longest" or "dialogue"
+    chapter_name: str
+    text: str
+
+
+@dataclass
+class BookSummary:
+    """What a sample run needs from a parsed book, without the book itself."""
+
+    chapter_count: int = 0
+    total_chunks: int = 0
+    total_chars: int = 0
+    samples: List[SampleChunk] = field(default_factory=list)
+
+
+def summarize_book(
+    parser: EPUBParser, chunker: TextChunker | None = None
+) -> BookSummary:
+    """
+    Walk the chapters once, keeping only counts and a few representative
+    chunks: the first, the longest and the most dialogue-heavy one.
+    """
+    chunker = chunker or TextChunker()
+    summary = BookSummary()
+    first = longest = dialogue = None
+    dialogue_score = 0.0
+
+    for chapter in parser.iter_chapters(annotate=False):
+        summary.chapter_count += 1
+        for chunk in chunker.chunk_elements(chapter.elements):
+            text = chunk.combined_text
+            summary.total_chunks += 1
+            summary.total_chars += len(text)
+
+            if first is None:
+                first = SampleChunk("first", chapter.name, text)
+            if longest is None or len(text) > len(longest.text):
+                longest = SampleChunk("longest", chapter.name, text)
+            if len(text) >= MIN_DIALOGUE_CHUNK_CHARS:
+                score = sum(1 for c in text if c in DIALOGUE_MARKS) / len(text)
+                if score > dialogue_score:
+                    dialogue = SampleChunk("dialogue", chapter.name, text)
+                    dialogue_score = score
+
+    seen = set()
+    for sample in (first, longest, dialogue):
+        if sample is not None and sample.text not in seen:
+            summary.samples.append(sample)
+            seen.add(sample.text)
+    return summary
+
+
+async def translate_samples(
+    summary: BookSummary,
+    model: str,
+    source_lang: str,
+    target_lang: str,
+) -> dict:
+    """
+    Translate the sample chunks with one model and project the full-book time
+    from the chars per second of compute time Ollama reports for them. Models
+    are sampled concurrently against one server, so wall time includes
+    queueing behind other models and is only reported as translation_time.
+    """
+    result = {
+        "model": model,
+        "translations": [],
+        "model_load_time": None,
+        "translation_time": 0.0,
+        "tokens_per_second": 0.0,
+        "projected_seconds": None,
+        "error": None,
+    }
+    prompt = PromptBuilder(source_lang, target_lang)
+    ollama = OllamaClient()
+    model_warmup = model_manager.acquire(model)
+
+    try:
+        result["model_load_time"] = await model_warmup
+
+        start = time.perf_counter()
+        for sample in summary.samples:
+            translated = await ollama.translate(
+                text=sample.text,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                model=model,
+                keep_alive=model_manager.keep_alive,
+                system_prompt=prompt.system_prompt,
+            )
+            result["translations"].append(translated)
+        elapsed = time.perf_counter() - start
+
+        sample_chars = sum(len(sample.text) for sample in summary.samples)
+        result["translation_time"] = round(elapsed, 2)
+        result["tokens_per_second"] = round(ollama.stats.tokens_per_second, 1)
+        compute = ollama.stats.compute_seconds
+        if sample_chars and compute:
+            result["projected_seconds"] = round(
+                compute / sample_chars * summary.total_chars, 1
+            )
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        result["error"] = str(e)
+    finally:
+        model_manager.release(model)
+        await ollama.close()
+
+    return result
@@ -1,12 +1,17 @@
 import asyncio
 import os
 import time
-from typing import Callable, Awaitable
+from typing import Callable, Awaitable, Dict
 from dataclasses import dataclass
 
-from .epub_parser import EPUBParser
+from .epub_parser import EPUBParser, create_parser
 from .chunker import TextChunker
+from .model_manager import model_manager
 from .ollama_client import OllamaClient
+from .prompts import PromptBuilder
+from .sampler import BookSummary
+from .work_queue import WorkQueue, DONE, FAILED, CANCELLED
+from ..config import CONTEXT_CHARS, PARSER_BACKEND
 from ..models.schemas import TranslationStatus
 
 
@@ -17,6 +22,7 @@ class TranslationJob:
     source_lang: str
     target_lang: str
     model: str
+    glossary: Dict[str, str] | None = None
     status: TranslationStatus = TranslationStatus.PENDING
     current_chapter: int = 0
     total_chapters: int = 0
@@ -25,6 +31,9 @@ class TranslationJob:
     completed_chunks: int = 0  # total completed chunks across all chapters
     total_chunks_all: int = 0  # total chunks across all chapters
     start_time: float | None = None
+    translation_start_time: float | None = None  # after the model is loaded
+    model_load_time: float | None = None
+    finished_at: float | None = None
     error_message: str | None = None
     output_path: str | None = None
 
@@ -39,42 +48,81 @@ class TranslationOrchestrator:
         upload_dir: str,
         output_dir: str,
         progress_callback: ProgressCallback,
+        work_queue: WorkQueue | None = None,
+        poll_interval: float = 0.5,
+        parser_backend: str = PARSER_BACKEND,
+        context_chars: int = CONTEXT_CHARS,
+        book_summary: BookSummary | None = None,
     ):
         self.job = job
         self.upload_dir = upload_dir
         self.output_dir = output_dir
         self.progress_callback = progress_callback
         self.is_cancelled = False
+        # When set, chunks are translated by worker processes instead
+        self.work_queue = work_queue
+        self.poll_interval = poll_interval
+        self.parser_backend = parser_backend
+        # Chunk totals counted when the file was uploaded, if available
+        self.book_summary = book_summary
 
         self.ollama = OllamaClient()
         self.chunker = TextChunker(max_chars=2000)
+        # Rolling context needs chunks translated in order, which workers
+        # do not guarantee
+        self.prompt = PromptBuilder(
+            source_lang=job.source_lang,
+            target_lang=job.target_lang,
+            glossary=job.glossary,
+            context_chars=0 if work_queue else context_chars,
+        )
 
     async def run(self) -> str:
         """Run the full translation pipeline. Returns output path."""
         file_path = os.path.join(self.upload_dir, f"{self.job.file_id}.epub")
         self.job.start_time = time.time()
 
+        # Workers own their models in distributed mode
+        model_warmup = None
+        if not self.work_queue:
+            model_warmup = model_manager.acquire(self.job.model)
+        pre_pass = None
+
         try:
             self.job.status = TranslationStatus.PARSING
             await self._notify_progress()
 
-            parser = EPUBParser(file_path)
-            chapters = parser.get_chapters()
-            self.job.total_chapters = len(chapters)
+            parser = create_parser(file_path, self.parser_backend)
+
+            if self.book_summary is not None and not self.work_queue:
+                self.job.total_chapters = self.book_summary.chapter_count
+                self.job.total_chunks_all = self.book_summary.total_chunks
+            else:
+                # Pre-pass for progress totals (and enqueueing); chapters are
+                # extracted again lazily below so only one chapter is held in
+                # memory at a time. Shielded: cancelling cannot stop the
+                # thread, so cleanup below waits for it rather than racing
+                # its enqueues.
+                pre_pass = asyncio.ensure_future(
+                    asyncio.to_thread(self._count_chunks, parser)
+                )
+                chunk_counts = await asyncio.shield(pre_pass)
+                self._check_cancelled()
+                self.job.total_chapters = len(chunk_counts)
+                self.job.total_chunks_all = sum(chunk_counts)
 
-            # Pre-calculate total chunks across all chapters
-            all_chapter_chunks = []
-            for chapter in chapters:
-                chunks = self.chunker.chunk_elements(chapter.elements)
-                all_chapter_chunks.append((chapter, chunks))
-                self.job.total_chunks_all += len(chunks)
+            # The model has been warming up while the book was parsed
+            if model_warmup is not None:
+                self.job.model_load_time = await model_warmup
+            self.job.translation_start_time = time.time()
 
             self.job.status = TranslationStatus.TRANSLATING
             await self._notify_progress()
 
-            for chapter, chunks in all_chapter_chunks:
+            for chapter in parser.iter_chapters():
                 self._check_cancelled()
 
+                chunks = self.chunker.chunk_elements(chapter.elements)
                 self.job.current_chapter = chapter.index + 1
                 self.job.total_chunks = len(chunks)
 
@@ -83,27 +131,36 @@ class TranslationOrchestrator:
                 for chunk in chunks:
                     self._check_cancelled()
 
+                    text = chunk.combined_text
                     self.job.current_chunk = chunk.chunk_id + 1
                     await self._notify_progress(
                         chapter_title=chapter.name,
-                        preview_original=chunk.combined_text[:100],
+                        preview_original=text[:100],
                     )
 
-                    translated = await self._translate_with_retry(chunk.combined_text)
+                    if self.work_queue:
+                        translated = await self._wait_for_worker(
+                            chapter.index, chunk.chunk_id
+                        )
+                    else:
+                        translated = await self._translate_with_retry(text)
 
                     translations = self.chunker.parse_translated_chunk(
                         chunk, translated
                     )
                     all_translations.update(translations)
+                    self.prompt.remember(list(translations.values()))
                     self.job.completed_chunks += 1
 
                     await self._notify_progress(
                         chapter_title=chapter.name,
-                        preview_original=chunk.combined_text[:100],
+                        preview_original=text[:100],
                         preview_translated=translated[:100],
                     )
 
                 parser.apply_translations(chapter.item, all_translations)
+                # Free per-chapter state before extracting the next chapter
+                del chapter, chunks, all_translations
 
             self.job.status = TranslationStatus.REBUILDING
             await self._notify_progress()
@@ -120,7 +177,12 @@ class TranslationOrchestrator:
 
         except asyncio.CancelledError:
             self.job.status = TranslationStatus.CANCELLED
-            await self.ollama.unload_model(self.job.model)
+            if pre_pass is not None and not pre_pass.done():
+                # Stops the pre-pass at the next chapter
+                self.is_cancelled = True
+                await asyncio.wait([pre_pass])
+            if self.work_queue:
+                await asyncio.to_thread(self.work_queue.cancel_job, self.job.job_id)
             await self._notify_progress()
             raise
 
@@ -131,7 +193,39 @@ class TranslationOrchestrator:
             raise
 
         finally:
+            if model_warmup is not None:
+                model_manager.release(self.job.model)
             await self.ollama.close()
+            if self.work_queue:
+                await asyncio.to_thread(self.work_queue.purge_job, self.job.job_id)
+
+    def _count_chunks(self, parser: EPUBParser) -> list[int]:
+        """
+        Count chunks per chapter without keeping any chapter in memory or
+        modifying its content. In distributed mode the chunks are enqueued
+        for workers as well. Stops early once the job is cancelled.
+        """
+        chunk_counts = []
+        for chapter in parser.iter_chapters(annotate=False):
+            if self.is_cancelled:
+                break
+            if self.work_queue:
+                chunks = self.chunker.chunk_elements(chapter.elements)
+                self.work_queue.enqueue(
+                    self.job.job_id,
+                    self.job.source_lang,
+                    self.job.target_lang,
+                    self.job.model,
+                    [
+                        (chapter.index, chunk.chunk_id, chunk.combined_text)
+                        for chunk in chunks
+                    ],
+                    system_prompt=self.prompt.system_prompt,
+                )
+                chunk_counts.append(len(chunks))
+            else:
+                chunk_counts.append(self.chunker.count_chunks(chapter.elements))
+        return chunk_counts
 
     def _check_cancelled(self):
         """Check if cancelled and raise CancelledError if so."""
@@ -150,6 +244,9 @@ class TranslationOrchestrator:
                     source_lang=self.job.source_lang,
                     target_lang=self.job.target_lang,
                     model=self.job.model,
+                    context=self.prompt.context,
+                    keep_alive=model_manager.keep_alive,
+                    system_prompt=self.prompt.system_prompt,
                 )
             except asyncio.CancelledError:
                 raise
@@ -160,6 +257,23 @@ class TranslationOrchestrator:
 
         raise last_error or Exception("Translation failed")
 
+    async def _wait_for_worker(self, chapter_index: int, chunk_id: int) -> str:
+        """Poll the work queue until a worker has translated the chunk."""
+        assert self.work_queue is not None
+
+        while True:
+            self._check_cancelled()
+            result = await asyncio.to_thread(
+                self.work_queue.get_result, self.job.job_id, chapter_index, chunk_id
+            )
+            if result is None or result.status == CANCELLED:
+                raise asyncio.CancelledError("Work item cancelled")
+            if result.status == DONE:
+                return result.result or ""
+            if result.status == FAILED:
+                raise Exception(result.error or "Translation failed")
+            await asyncio.sleep(self.poll_interval)
+
     async def _notify_progress(
         self,
         chapter_title: str = "",
@@ -173,8 +287,8 @@ class TranslationOrchestrator:
             percentage = (self.job.completed_chunks / self.job.total_chunks_all) * 100
             percentage = min(percentage, 100.0)  # Clamp to 100%
 
-            if self.job.start_time and self.job.completed_chunks > 0:
-                elapsed = time.time() - self.job.start_time
+            if self.job.translation_start_time and self.job.completed_chunks > 0:
+                elapsed = time.time() - self.job.translation_start_time
                 avg_time_per_chunk = elapsed / self.job.completed_chunks
                 remaining_chunks = self.job.total_chunks_all - self.job.completed_chunks
                 estimated_time = avg_time_per_chunk * remaining_chunks
@@ -182,6 +296,7 @@ class TranslationOrchestrator:
         message = {
             "type": "progress",
             "job_id": self.job.job_id,
+            "timestamp": time.time(),
             "status": self.job.status.value,
             "chapter_current": self.job.current_chapter,
             "chapter_total": self.job.total_chapters,
@@ -192,6 +307,8 @@ class TranslationOrchestrator:
             "estimated_time_remaining": round(estimated_time, 1),
             "preview_original": preview_original,
             "preview_translated": preview_translated,
+            "model_load_time": self.job.model_load_time,
+            "translation_time": round(self._translation_time(), 1),
             "error_message": self.job.error_message,
             "download_url": f"/api/download/{self.job.job_id}"
             if self.job.status == TranslationStatus.COMPLETED
@@ -200,6 +317,12 @@ class TranslationOrchestrator:
 
         await self.progress_callback(message)
 
+    def _translation_time(self) -> float:
+        """Seconds spent translating, excluding model load and parsing."""
+        if not self.job.translation_start_time:
+            return 0.0
+        return time.time() - self.job.translation_start_time
+
     def cancel(self):
         """Mark the job as cancelled."""
         self.is_cancelled = True
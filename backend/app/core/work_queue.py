@@ -0,0 +1,282 @@
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+
+PENDING = "pending"
+CLAIMED = "claimed"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+@dataclass
+class WorkItem:
+    item_id: int
+    job_id: str
+    chapter_index: int
+    chunk_id: int
+    text: str
+    source_lang: str
+    target_lang: str
+    model: str
+    attempts: int
+    system_prompt: str | None = None
+
+
+@dataclass
+class WorkResult:
+    status: str
+    result: str | None
+    error: str | None
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    chapter_index INTEGER NOT NULL,
+    chunk_id INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    source_lang TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    model TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id TEXT,
+    claimed_at REAL,
+    not_before REAL,
+    result TEXT,
+    error TEXT,
+    UNIQUE (job_id, chapter_index, chunk_id)
+);
+CREATE INDEX IF NOT EXISTS idx_work_items_status ON work_items (status, id);
+CREATE TABLE IF NOT EXISTS work_jobs (
+    job_id TEXT PRIMARY KEY,
+    system_prompt TEXT
+);
+"""
+
+
+class WorkQueue:
+    """
+    Durable chunk-level work queue backed by a single SQLite file.
+
+    The API process enqueues chunks and polls for results; worker processes
+    claim chunks, translate them and write the result back. The default
+    rollback journal is used instead of WAL so the file can live on a
+    shared mount used by workers on other hosts.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        lease_seconds: float = 600.0,
+        max_attempts: int = 3,
+        retry_delay: float = 1.0,
+    ):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        # Failed items wait retry_delay * 2 ** (attempts - 1) before retrying
+        self.retry_delay = retry_delay
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+            # Queues created before retries were delayed lack not_before
+            columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(work_items)")
+            }
+            if "not_before" not in columns:
+                conn.execute("ALTER TABLE work_items ADD COLUMN not_before REAL")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Short-lived connections keep the queue safe to use from
+        # asyncio.to_thread and from several processes at once.
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def enqueue(
+        self,
+        job_id: str,
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        chunks: Iterable[tuple[int, int, str]],
+        system_prompt: str | None = None,
+    ) -> int:
+        """
+        Enqueue (chapter_index, chunk_id, text) tuples for a job.
+        The system prompt is stored once per job rather than per item.
+        Returns the number of items added.
+        """
+        rows = [
+            (job_id, chapter_index, chunk_id, text, source_lang, target_lang, model)
+            for chapter_index, chunk_id, text in chunks
+        ]
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO work_jobs (job_id, system_prompt) "
+                "VALUES (?, ?)",
+                (job_id, system_prompt),
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO work_items "
+                "(job_id, chapter_index, chunk_id, text, source_lang, target_lang, model) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def claim(self, worker_id: str) -> WorkItem | None:
+        """
+        Claim the oldest pending item that is due, reclaiming expired leases
+        first. An item whose lease expired on its last attempt (e.g. it keeps
+        crashing or hanging its worker) is marked failed instead.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE work_items SET "
+                "status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                "error = CASE WHEN attempts >= ? THEN ? ELSE error END, "
+                "worker_id = NULL "
+                "WHERE status = ? AND claimed_at < ?",
+                (
+                    self.max_attempts,
+                    FAILED,
+                    PENDING,
+                    self.max_attempts,
+                    "Lease expired",
+                    CLAIMED,
+                    now - self.lease_seconds,
+                ),
+            )
+            row = conn.execute(
+                "SELECT id, job_id, chapter_index, chunk_id, text, source_lang, "
+                "target_lang, model, attempts FROM work_items "
+                "WHERE status = ? AND (not_before IS NULL OR not_before <= ?) "
+                "ORDER BY id LIMIT 1",
+                (PENDING, now),
+            ).fetchone()
+            if row is None:
+                return None
+
+            job_row = conn.execute(
+                "SELECT system_prompt FROM work_jobs WHERE job_id = ?", (row[1],)
+            ).fetchone()
+
+            conn.execute(
+                "UPDATE work_items SET status = ?, worker_id = ?, claimed_at = ?, "
+                "attempts = attempts + 1 WHERE id = ?",
+                (CLAIMED, worker_id, now, row[0]),
+            )
+
+        return WorkItem(
+            item_id=row[0],
+            job_id=row[1],
+            chapter_index=row[2],
+            chunk_id=row[3],
+            text=row[4],
+            source_lang=row[5],
+            target_lang=row[6],
+            model=row[7],
+            attempts=row[8] + 1,
+            system_prompt=job_row[0] if job_row else None,
+        )
+
+    def complete(self, item_id: int, worker_id: str, result: str) -> bool:
+        """Store a translation. Ignored if the lease was lost or job cancelled."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE work_items SET status = ?, result = ?, error = NULL "
+                "WHERE id = ? AND status = ? AND worker_id = ?",
+                (DONE, result, item_id, CLAIMED, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, item_id: int, worker_id: str, error: str) -> bool:
+        """
+        Record a failure. The item becomes claimable again after a backoff,
+        until max_attempts is reached.
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts FROM work_items "
+                "WHERE id = ? AND status = ? AND worker_id = ?",
+                (item_id, CLAIMED, worker_id),
+            ).fetchone()
+            if row is None:
+                return False
+
+            attempts = row[0]
+            status = FAILED if attempts >= self.max_attempts else PENDING
+            not_before = time.time() + self.retry_delay * 2 ** (attempts - 1)
+            conn.execute(
+                "UPDATE work_items SET status = ?, worker_id = NULL, error = ?, "
+                "not_before = ? WHERE id = ?",
+                (status, error, not_before, item_id),
+            )
+            return True
+
+    def get_result(
+        self, job_id: str, chapter_index: int, chunk_id: int
+    ) -> WorkResult | None:
+        """Get the current state of a single chunk."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT status, result, error FROM work_items "
+                "WHERE job_id = ? AND chapter_index = ? AND chunk_id = ?",
+                (job_id, chapter_index, chunk_id),
+            ).fetchone()
+        if row is None:
+            return None
+        return WorkResult(status=row[0], result=row[1], error=row[2])
+
+    def cancel_job(self, job_id: str) -> int:
+        """Cancel all unfinished items of a job."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE work_items SET status = ? "
+                "WHERE job_id = ? AND status IN (?, ?)",
+                (CANCELLED, job_id, PENDING, CLAIMED),
+            )
+            return cursor.rowcount
+
+    def purge_job(self, job_id: str) -> int:
+        """Delete all items of a finished job."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM work_jobs WHERE job_id = ?", (job_id,))
+            cursor = conn.execute(
+                "DELETE FROM work_items WHERE job_id = ?", (job_id,)
+            )
+            return cursor.rowcount
+
+    def purge_all(self) -> int:
+        """
+        Delete every job and item. Jobs live in the API process's memory, so
+        after a restart no surviving job owns anything left in the queue.
+        """
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM work_jobs")
+            cursor = conn.execute("DELETE FROM work_items")
+            return cursor.rowcount
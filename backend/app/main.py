@@ -2,6 +2,9 @@ import asyncio
 import os
 import subprocess
 import shutil
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from uuid import uuid4
 from typing import Dict
 
@@ -15,19 +18,66 @@ from fastapi import (
 )
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
+from starlette.background import BackgroundTask
 
 from .api.websocket import manager
-from .core.epub_parser import EPUBParser
+from .config import UPLOAD_DIR, OUTPUT_DIR, EXECUTION_MODE, QUEUE_PATH
+from .core.epub_parser import create_parser
+from .core.janitor import StorageJanitor
+from .core.metrics import LoopLagMonitor, current_rss_bytes
+from .core.model_manager import model_manager
+from .core.sampler import BookSummary, summarize_book, translate_samples
 from .core.translator import TranslationOrchestrator, TranslationJob
 from .core.ollama_client import OllamaClient
+from .core.work_queue import WorkQueue
 from .models.schemas import (
     TranslationRequest,
     FileUploadResponse,
     JobStatusResponse,
     TranslationStatus,
+    SampleRequest,
+    SampleResponse,
+    SampleChunkInfo,
+    ModelSampleResult,
 )
 
-app = FastAPI(title="EPUB Translator")
+jobs: Dict[str, TranslationJob] = {}
+orchestrators: Dict[str, TranslationOrchestrator] = {}
+tasks: Dict[str, asyncio.Task] = {}
+
+# Parse summaries of recent uploads, used by /api/sample
+MAX_CACHED_SUMMARIES = 32
+summaries: "OrderedDict[str, BookSummary]" = OrderedDict()
+
+janitor = StorageJanitor(jobs, upload_dir=UPLOAD_DIR, output_dir=OUTPUT_DIR)
+loop_monitor = LoopLagMonitor()
+
+# Set up in lifespan() when running in distributed mode
+work_queue: WorkQueue | None = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global work_queue
+
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    if EXECUTION_MODE == "distributed":
+        work_queue = WorkQueue(QUEUE_PATH)
+        # Jobs are not persisted, so items left by a previous run are orphans
+        await asyncio.to_thread(work_queue.purge_all)
+
+    janitor_task = asyncio.create_task(janitor.run())
+    monitor_task = asyncio.create_task(loop_monitor.run())
+    try:
+        yield
+    finally:
+        janitor_task.cancel()
+        monitor_task.cancel()
+        await model_manager.close()
+
+
+app = FastAPI(title="EPUB Translator", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -37,17 +87,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-UPLOAD_DIR = os.path.join(BASE_DIR, "uploads")
-OUTPUT_DIR = os.path.join(BASE_DIR, "outputs")
-
-os.makedirs(UPLOAD_DIR, exist_ok=True)
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-jobs: Dict[str, TranslationJob] = {}
-orchestrators: Dict[str, TranslationOrchestrator] = {}
-tasks: Dict[str, asyncio.Task] = {}
-
 
 @app.get("/api/ollama/status")
 async def get_ollama_status():
@@ -123,14 +162,68 @@ async def upload_file(file: UploadFile = File(...)):
     with open(file_path, "wb") as f:
         f.write(content)
 
-    parser = EPUBParser(file_path)
-    chapters = parser.get_chapters()
+    summary = await get_book_summary(file_id)
 
     return FileUploadResponse(
         file_id=file_id,
         filename=file.filename or "unknown.epub",
         file_size=len(content),
-        chapter_count=len(chapters),
+        chapter_count=summary.chapter_count,
+    )
+
+
+async def get_book_summary(file_id: str) -> BookSummary:
+    """Parse summary of an uploaded file, parsed once and then cached."""
+    summary = summaries.get(file_id)
+    if summary is not None:
+        summaries.move_to_end(file_id)
+        return summary
+
+    file_path = os.path.join(UPLOAD_DIR, f"{file_id}.epub")
+    summary = await asyncio.to_thread(
+        lambda: summarize_book(create_parser(file_path))
+    )
+    summaries[file_id] = summary
+    while len(summaries) > MAX_CACHED_SUMMARIES:
+        summaries.popitem(last=False)
+    return summary
+
+
+@app.post("/api/sample", response_model=SampleResponse)
+async def sample_translation(request: SampleRequest):
+    """Translate a few representative chunks with several models to compare them."""
+    file_path = os.path.join(UPLOAD_DIR, f"{request.file_id}.epub")
+    if not os.path.exists(file_path):
+        raise HTTPException(status_code=404, detail="File not found")
+    if not request.models:
+        raise HTTPException(status_code=400, detail="No models requested")
+
+    janitor.touch_upload(request.file_id)
+    summary = await get_book_summary(request.file_id)
+
+    results = await asyncio.gather(
+        *(
+            translate_samples(
+                summary,
+                model=model,
+                source_lang=request.source_language,
+                target_lang=request.target_language,
+            )
+            for model in dict.fromkeys(request.models)
+        )
+    )
+
+    return SampleResponse(
+        file_id=request.file_id,
+        total_chunks=summary.total_chunks,
+        total_chars=summary.total_chars,
+        samples=[
+            SampleChunkInfo(
+                kind=sample.kind, chapter_name=sample.chapter_name, text=sample.text
+            )
+            for sample in summary.samples
+        ],
+        results=[ModelSampleResult(**result) for result in results],
     )
 
 
@@ -141,6 +234,9 @@ async def start_translation(request: TranslationRequest):
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail="File not found")
 
+    janitor.touch_upload(request.file_id)
+    summary = await get_book_summary(request.file_id)
+
     job_id = str(uuid4())
     job = TranslationJob(
         job_id=job_id,
@@ -148,6 +244,7 @@ async def start_translation(request: TranslationRequest):
         source_lang=request.source_language,
         target_lang=request.target_language,
         model=request.model,
+        glossary=request.glossary,
     )
     jobs[job_id] = job
 
@@ -159,6 +256,8 @@ async def start_translation(request: TranslationRequest):
         upload_dir=UPLOAD_DIR,
         output_dir=OUTPUT_DIR,
         progress_callback=progress_callback,
+        work_queue=work_queue,
+        book_summary=summary,
     )
     orchestrators[job_id] = orchestrator
 
@@ -182,6 +281,7 @@ async def run_translation(job_id: str):
     except Exception:
         pass
     finally:
+        orchestrator.job.finished_at = time.time()
         if job_id in orchestrators:
             del orchestrators[job_id]
         if job_id in tasks:
@@ -194,6 +294,7 @@ async def get_job_status(job_id: str):
     job = jobs.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
+    janitor.touch(job_id)
 
     return JobStatusResponse(
         job_id=job.job_id,
@@ -203,6 +304,7 @@ async def get_job_status(job_id: str):
         current_chunk=job.current_chunk,
         total_chunks=job.total_chunks,
         percentage=0.0,
+        model_load_time=job.model_load_time,
         error_message=job.error_message,
         download_url=f"/api/download/{job_id}"
         if job.status == TranslationStatus.COMPLETED
@@ -246,13 +348,39 @@ async def download_translated(job_id: str):
     if not job.output_path or not os.path.exists(job.output_path):
         raise HTTPException(status_code=404, detail="Output file not found")
 
+    # Keeps the janitor away from the file until the response is sent
+    janitor.start_download(job_id)
     return FileResponse(
         job.output_path,
         media_type="application/epub+zip",
         filename=f"translated_{job_id}.epub",
+        background=BackgroundTask(janitor.finish_download, job_id),
     )
 
 
+@app.get("/api/admin/storage")
+async def get_storage_usage():
+    """Current disk usage of uploads and outputs, and retained jobs."""
+    return janitor.usage()
+
+
+@app.get("/api/admin/metrics")
+async def get_metrics():
+    """Process health: event loop lag, memory and in-memory state sizes."""
+    return {
+        "timestamp": time.time(),
+        "rss_bytes": current_rss_bytes(),
+        "loop_lag": loop_monitor.snapshot(),
+        "jobs": len(jobs),
+        "running_jobs": len(tasks),
+        "websocket_connections": sum(
+            len(connections) for connections in manager.active_connections.values()
+        ),
+        "cached_summaries": len(summaries),
+        "active_models": model_manager.active_models(),
+    }
+
+
 @app.websocket("/ws/progress/{job_id}")
 async def websocket_progress(websocket: WebSocket, job_id: str):
     """WebSocket endpoint for real-time progress updates."""
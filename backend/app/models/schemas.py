@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from enum import Enum
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 class TranslationStatus(str, Enum):
@@ -18,6 +18,7 @@ class TranslationRequest(BaseModel):
     source_language: str
     target_language: str
     model: str
+    glossary: Optional[Dict[str, str]] = None
 
 
 class FileUploadResponse(BaseModel):
@@ -35,6 +36,7 @@ class JobStatusResponse(BaseModel):
     current_chunk: int = 0
     total_chunks: int = 0
     percentage: float = 0.0
+    model_load_time: Optional[float] = None
     error_message: Optional[str] = None
     download_url: Optional[str] = None
 
@@ -42,6 +44,7 @@ class JobStatusResponse(BaseModel):
 class ProgressMessage(BaseModel):
     type: str
     job_id: str
+    timestamp: float = 0.0
     status: TranslationStatus
     chapter_current: int = 0
     chapter_total: int = 0
@@ -52,5 +55,38 @@ class ProgressMessage(BaseModel):
     estimated_time_remaining: float = 0.0
     preview_original: str = ""
     preview_translated: str = ""
+    model_load_time: Optional[float] = None
+    translation_time: float = 0.0
     error_message: Optional[str] = None
     download_url: Optional[str] = None
+
+
+class SampleRequest(BaseModel):
+    file_id: str
+    source_language: str
+    target_language: str
+    models: List[str]
+
+
+class SampleChunkInfo(BaseModel):
+    kind: str
+    chapter_name: str
+    text: str
+
+
+class ModelSampleResult(BaseModel):
+    model: str
+    translations: List[str] = []
+    model_load_time: Optional[float] = None
+    translation_time: float = 0.0
+    tokens_per_second: float = 0.0
+    projected_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+
+class SampleResponse(BaseModel):
+    file_id: str
+    total_chunks: int
+    total_chars: int
+    samples: List[SampleChunkInfo]
+    results: List[ModelSampleResult]
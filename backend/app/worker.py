@@ -0,0 +1,70 @@
+import argparse
+import asyncio
+import os
+import socket
+
+from .config import MODEL_KEEP_ALIVE, OLLAMA_BASE_URL, QUEUE_PATH
+from .core.ollama_client import OllamaClient
+from .core.work_queue import WorkQueue
+
+
+async def run_worker(
+    queue: WorkQueue,
+    worker_id: str,
+    ollama_url: str = OLLAMA_BASE_URL,
+    poll_interval: float = 1.0,
+) -> None:
+    """Claim chunks from the queue, translate them and report results."""
+    ollama = OllamaClient(base_url=ollama_url)
+    try:
+        while True:
+            item = await asyncio.to_thread(queue.claim, worker_id)
+            if item is None:
+                await asyncio.sleep(poll_interval)
+                continue
+
+            try:
+                translated = await ollama.translate(
+                    text=item.text,
+                    source_lang=item.source_lang,
+                    target_lang=item.target_lang,
+                    model=item.model,
+                    keep_alive=MODEL_KEEP_ALIVE,
+                    system_prompt=item.system_prompt,
+                )
+            except Exception as e:
+                # The queue holds the item back for a while before a retry
+                await asyncio.to_thread(queue.fail, item.item_id, worker_id, str(e))
+                continue
+
+            await asyncio.to_thread(queue.complete, item.item_id, worker_id, translated)
+    finally:
+        await ollama.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="EPUB Translator worker")
+    parser.add_argument("--queue", default=QUEUE_PATH, help="Path to queue.db")
+    parser.add_argument("--ollama-url", default=OLLAMA_BASE_URL)
+    parser.add_argument(
+        "--worker-id", default=f"{socket.gethostname()}-{os.getpid()}"
+    )
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    args = parser.parse_args()
+
+    queue = WorkQueue(args.queue)
+    try:
+        asyncio.run(
+            run_worker(
+                queue,
+                worker_id=args.worker_id,
+                ollama_url=args.ollama_url,
+                poll_interval=args.poll_interval,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Import-time budget check for the backend entry points.
+
+Imports each entry point in a fresh interpreter with `python -X importtime`
+and fails (exit code 1) when it exceeds its time budget or eagerly imports
+a dependency that should only be loaded on first use.
+
+Usage (from backend/):
+    python -m benchmarks.bench_import [--budget-scale 1.0] [--top 5]
+"""
+
+import argparse
+import subprocess
+import sys
+
+# entry point -> (module, budget in ms, modules that must not be imported)
+ENTRY_POINTS = {
+    "api": ("app.main", 1000, ["ebooklib", "bs4", "lxml", "httpx"]),
+    "worker": ("app.worker", 250, ["ebooklib", "bs4", "lxml", "httpx", "fastapi"]),
+}
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Cumulative import time in microseconds of every module imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="multiply every budget, e.g. for slow CI machines",
+    )
+    arg_parser.add_argument("--top", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    failed = False
+    for name, (module, budget_ms, forbidden) in ENTRY_POINTS.items():
+        times = import_times(module)
+        total_ms = times[module] / 1000
+        budget_ms *= args.budget_scale
+        eager = [dep for dep in forbidden if dep in times]
+
+        ok = total_ms <= budget_ms and not eager
+        failed |= not ok
+        print(
+            f"{'ok  ' if ok else 'FAIL'} {name:<7} {module:<12} "
+            f"{total_ms:>7.1f} ms (budget {budget_ms:.0f} ms)"
+        )
+        if eager:
+            print(f"     imported eagerly: {', '.join(eager)}")
+
+        top_level = sorted(
+            (t, mod) for mod, t in times.items() if mod != module and "." not in mod
+        )
+        for t, mod in top_level[-args.top :][::-1]:
+            print(f"     {t / 1000:>7.1f} ms  {mod}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Parse+apply throughput of the EPUB parser backends.
+
+Usage (from backend/):
+    python -m benchmarks.bench_parser [--chapters 20] [--paragraphs 200]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import warnings
+
+import ebooklib
+
+from app.core.epub_parser import PARSER_BACKENDS, create_parser
+from .fixtures import make_epub
+
+
+def _document_bytes(file_path: str) -> int:
+    parser = create_parser(file_path, "lxml")
+    return sum(
+        len(item.content or b"")
+        for item in parser.book.get_items_of_type(ebooklib.ITEM_DOCUMENT)
+    )
+
+
+def bench_backend(file_path: str, backend: str, repeat: int) -> dict:
+    """Best-of-`repeat` extraction and apply times for one backend."""
+    best_extract = best_apply = float("inf")
+
+    for _ in range(repeat):
+        parser = create_parser(file_path, backend)
+
+        start = time.perf_counter()
+        chapters = parser.get_chapters()
+        extracted = time.perf_counter()
+        for chapter in chapters:
+            translations = {e.element_id: e.text.upper() for e in chapter.elements}
+            parser.apply_translations(chapter.item, translations)
+        applied = time.perf_counter()
+
+        best_extract = min(best_extract, extracted - start)
+        best_apply = min(best_apply, applied - extracted)
+
+    return {
+        "backend": backend,
+        "elements": sum(len(c.elements) for c in chapters),
+        "extract": best_extract,
+        "apply": best_apply,
+    }
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--chapters", type=int, default=20)
+    arg_parser.add_argument("--paragraphs", type=int, default=200)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    # BeautifulSoup warns about parsing XHTML with an HTML parser
+    warnings.simplefilter("ignore")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = make_epub(
+            os.path.join(tmp, "book.epub"), args.chapters, args.paragraphs
+        )
+        size_mb = _document_bytes(file_path) / 1_000_000
+        print(f"documents: {size_mb:.2f} MB in {args.chapters} chapters")
+        print(
+            f"{'backend':<8} {'elements':>9} {'extract s':>10} {'apply s':>9} "
+            f"{'MB/s':>8}"
+        )
+
+        for backend in PARSER_BACKENDS:
+            result = bench_backend(file_path, backend, args.repeat)
+            total = result["extract"] + result["apply"]
+            print(
+                f"{backend:<8} {result['elements']:>9} {result['extract']:>10.3f} "
+                f"{result['apply']:>9.3f} {size_mb / total:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
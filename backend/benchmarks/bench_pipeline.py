@@ -0,0 +1,204 @@
+"""
+End-to-end translation pipeline benchmark against the fake Ollama backend.
+
+Runs the streaming TranslationOrchestrator and, for reference, the previous
+pipeline (every chapter and chunk materialized with plain dataclass records
+and a stored combined_text before translating) on both parser backends.
+Each run happens in a fresh interpreter and reports wall time, peak RSS
+and peak RSS above the interpreter's baseline after imports, so memory
+held by lxml/libxml2 trees is counted too. Unix only (uses resource).
+
+Usage (from backend/):
+    python -m benchmarks.bench_pipeline [--chapters 40] [--paragraphs 200]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from dataclasses import dataclass
+from typing import List
+
+import httpx
+
+from app.core.chunker import TextChunker
+from app.core.epub_parser import PARSER_BACKENDS, create_parser
+from app.core.metrics import current_rss_bytes
+from app.core.model_manager import model_manager
+from app.core.ollama_client import OllamaClient
+from app.core.translator import TranslationJob, TranslationOrchestrator
+from .fake_ollama import create_app
+from .fixtures import make_epub
+
+PHASES = ["previous", "pipeline"]
+
+
+@dataclass
+class PreviousElement:
+    """TranslatableElement as it was before it used slots."""
+
+    element_id: str
+    text: str
+    tag_name: str
+
+
+@dataclass
+class PreviousChunk:
+    """TranslationChunk as it was, storing a copy of the combined text."""
+
+    chunk_id: int
+    elements: List[PreviousElement]
+    combined_text: str
+
+
+def _fake_client() -> OllamaClient:
+    return OllamaClient(
+        base_url="http://fake-ollama",
+        transport=httpx.ASGITransport(app=create_app()),
+    )
+
+
+def _peak_rss_bytes() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def run_pipeline(upload_dir: str, output_dir: str, backend: str) -> None:
+    async def progress_callback(message: dict) -> None:
+        pass
+
+    job = TranslationJob(
+        job_id=f"bench-{backend}",
+        file_id="book",
+        source_lang="English",
+        target_lang="Korean",
+        model="fake:latest",
+    )
+    orchestrator = TranslationOrchestrator(
+        job=job,
+        upload_dir=upload_dir,
+        output_dir=output_dir,
+        progress_callback=progress_callback,
+        parser_backend=backend,
+    )
+    orchestrator.ollama = _fake_client()
+
+    async def run() -> None:
+        model_manager.ollama = _fake_client()
+        try:
+            await orchestrator.run()
+        finally:
+            await model_manager.close()
+
+    asyncio.run(run())
+
+
+def run_previous(upload_dir: str, output_dir: str, backend: str) -> None:
+    """The pipeline before streaming: hold the whole book, then translate."""
+    chunker = TextChunker(max_chars=2000)
+    parser = create_parser(os.path.join(upload_dir, "book.epub"), backend)
+
+    all_chapter_chunks = []
+    for chapter in parser.get_chapters():
+        chapter.elements = [
+            PreviousElement(elem.element_id, elem.text, elem.tag_name)
+            for elem in chapter.elements
+        ]
+        chunks = [
+            PreviousChunk(chunk.chunk_id, chunk.elements, chunk.combined_text)
+            for chunk in chunker.chunk_elements(chapter.elements)
+        ]
+        all_chapter_chunks.append((chapter, chunks))
+
+    async def translate_all() -> None:
+        ollama = _fake_client()
+        try:
+            for chapter, chunks in all_chapter_chunks:
+                all_translations = {}
+                for chunk in chunks:
+                    translated = await ollama.translate(
+                        text=chunk.combined_text,
+                        source_lang="English",
+                        target_lang="Korean",
+                        model="fake:latest",
+                    )
+                    all_translations.update(
+                        chunker.parse_translated_chunk(chunk, translated)
+                    )
+                parser.apply_translations(chapter.item, all_translations)
+        finally:
+            await ollama.close()
+
+    asyncio.run(translate_all())
+    parser.save(os.path.join(output_dir, f"translated_previous-{backend}.epub"))
+
+
+def measure_phase(phase: str, backend: str, work_dir: str) -> None:
+    """Run one phase and print its measurements as JSON (child process)."""
+    warnings.simplefilter("ignore")
+    # Load the parser dependencies up front so the baseline includes them
+    import bs4, ebooklib, lxml.html  # noqa: E401, F401
+
+    baseline = current_rss_bytes()
+    run = run_pipeline if phase == "pipeline" else run_previous
+    start = time.perf_counter()
+    run(work_dir, work_dir, backend)
+    elapsed = time.perf_counter() - start
+    peak = _peak_rss_bytes()
+    print(json.dumps({"elapsed": elapsed, "peak": peak, "baseline": baseline}))
+
+
+def run_phase(phase: str, backend: str, work_dir: str) -> dict:
+    """Measure a phase in a fresh interpreter so peaks do not carry over."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from benchmarks.bench_pipeline import measure_phase; "
+            f"measure_phase({phase!r}, {backend!r}, {work_dir!r})",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--chapters", type=int, default=40)
+    arg_parser.add_argument("--paragraphs", type=int, default=200)
+    args = arg_parser.parse_args()
+
+    warnings.simplefilter("ignore")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = make_epub(
+            os.path.join(tmp, "book.epub"), args.chapters, args.paragraphs
+        )
+        size_mb = os.path.getsize(file_path) / 1_000_000
+        print(f"book: {size_mb:.2f} MB compressed, {args.chapters} chapters")
+        print(
+            f"{'backend':<8} {'phase':<10} {'time s':>8} "
+            f"{'peak RSS MB':>12} {'above base MB':>14}"
+        )
+
+        for backend in PARSER_BACKENDS:
+            for phase in PHASES:
+                m = run_phase(phase, backend, tmp)
+                print(
+                    f"{backend:<8} {phase:<10} {m['elapsed']:>8.2f} "
+                    f"{m['peak'] / 1_000_000:>12.1f} "
+                    f"{(m['peak'] - m['baseline']) / 1_000_000:>14.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Prompt evaluation cost of the per-job prompt builder and rolling context.
+
+Translates the same chunks once per variant against a running Ollama
+server and compares the prompt_eval_duration it reports:
+
+- previous: the prompt format before PromptBuilder, with the system prompt
+  rebuilt inside OllamaClient on every call and no context
+- builder: the job's static system prompt from PromptBuilder
+- builder + context: as above, plus the rolling context window
+
+The system prompt was already byte-identical across a job's calls before
+PromptBuilder, so "previous" and "builder" are expected to cost the same;
+the comparison guards against regressions and shows the price of the
+rolling context. The model is reloaded before each variant so no variant
+starts with another one's cached prefix. No reference numbers are
+included: this has not been measured against a real server yet.
+
+Usage (from backend/):
+    python -m benchmarks.bench_prompt_cache --model translategemma:4b [--chunks 10]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import warnings
+
+from app.config import OLLAMA_BASE_URL
+from app.core.chunker import TextChunker
+from app.core.epub_parser import create_parser
+from app.core.ollama_client import GenerationStats, OllamaClient
+from app.core.prompts import PromptBuilder
+from .fixtures import make_epub
+
+
+async def run_variant(
+    client: OllamaClient,
+    model: str,
+    chunks,
+    use_builder: bool = True,
+    context_chars: int = 0,
+) -> GenerationStats:
+    prompt = PromptBuilder("English", "Korean", context_chars=context_chars)
+
+    # Start every variant from a freshly loaded model with an empty cache
+    await client.unload_model(model)
+    await client.load_model(model, keep_alive="5m")
+    client.stats = GenerationStats()
+
+    for chunk in chunks:
+        if use_builder:
+            translated = await client.translate(
+                text=chunk.combined_text,
+                source_lang="English",
+                target_lang="Korean",
+                model=model,
+                context=prompt.context,
+                system_prompt=prompt.system_prompt,
+            )
+            prompt.remember([translated])
+        else:
+            translated = await client.translate(
+                text=chunk.combined_text,
+                source_lang="English",
+                target_lang="Korean",
+                model=model,
+            )
+
+    return client.stats
+
+
+async def run(args) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = make_epub(os.path.join(tmp, "book.epub"), chapters=2)
+        chapter = create_parser(file_path, "lxml").get_chapters()[0]
+    chunks = TextChunker(max_chars=2000).chunk_elements(chapter.elements)
+    chunks = chunks[: args.chunks]
+
+    client = OllamaClient(base_url=args.base_url)
+    try:
+        variants = [
+            ("previous", dict(use_builder=False)),
+            ("builder", dict()),
+            ("builder + context", dict(context_chars=args.context_chars)),
+        ]
+        print(
+            f"{'variant':<18} {'calls':>6} {'prompt tok':>11} "
+            f"{'prompt eval ms':>15} {'ms/call':>9}"
+        )
+        for name, options in variants:
+            stats = await run_variant(client, args.model, chunks, **options)
+            total_ms = stats.prompt_eval_duration / 1e6
+            print(
+                f"{name:<18} {stats.calls:>6} {stats.prompt_eval_count:>11} "
+                f"{total_ms:>15.1f} {total_ms / max(stats.calls, 1):>9.1f}"
+            )
+    finally:
+        await client.close()
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--model", required=True)
+    arg_parser.add_argument("--base-url", default=OLLAMA_BASE_URL)
+    arg_parser.add_argument("--chunks", type=int, default=10)
+    arg_parser.add_argument("--context-chars", type=int, default=600)
+    args = arg_parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
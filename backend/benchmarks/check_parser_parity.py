@@ -0,0 +1,89 @@
+"""
+Check that the parser backends extract and write the same book.
+
+Runs extraction and apply with every backend on a synthetic book that
+includes nested translatable blocks (blockquote/li/td holding several
+paragraphs), then compares the extracted elements and the written
+chapters, ignoring whitespace. Exits with code 1 on any difference.
+
+Usage (from backend/):
+    python -m benchmarks.check_parser_parity [--chapters 5] [--paragraphs 20]
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import warnings
+
+import ebooklib
+from ebooklib import epub
+
+from app.core.epub_parser import PARSER_BACKENDS, create_parser
+from .fixtures import make_epub
+
+
+def translate_book(file_path: str, output_path: str, backend: str) -> list:
+    """Uppercase every element with one backend; returns the extracted elements."""
+    parser = create_parser(file_path, backend)
+    extracted = []
+    for chapter in parser.iter_chapters():
+        extracted.append(
+            [(e.element_id, e.text, e.tag_name) for e in chapter.elements]
+        )
+        parser.apply_translations(
+            chapter.item, {e.element_id: e.text.upper() for e in chapter.elements}
+        )
+    parser.save(output_path)
+    return extracted
+
+
+def written_chapters(output_path: str) -> list[bytes]:
+    book = epub.read_epub(output_path, options={"ignore_ncx": False})
+    return [
+        re.sub(rb"\s+", b"", item.get_content())
+        for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT)
+    ]
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--chapters", type=int, default=5)
+    arg_parser.add_argument("--paragraphs", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    warnings.simplefilter("ignore")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = make_epub(
+            os.path.join(tmp, "book.epub"), args.chapters, args.paragraphs
+        )
+        results = {}
+        for backend in PARSER_BACKENDS:
+            output_path = os.path.join(tmp, f"{backend}.epub")
+            extracted = translate_book(file_path, output_path, backend)
+            results[backend] = (extracted, written_chapters(output_path))
+
+    reference, *others = PARSER_BACKENDS
+    failed = False
+    for backend in others:
+        for what, index in (("extracted elements", 0), ("written chapters", 1)):
+            expected, actual = results[reference][index], results[backend][index]
+            mismatches = [
+                i for i, (a, b) in enumerate(zip(expected, actual)) if a != b
+            ]
+            if len(expected) != len(actual) or mismatches:
+                failed = True
+                print(
+                    f"FAIL {backend}: {what} differ from {reference} "
+                    f"(chapters {mismatches or 'count'})"
+                )
+            else:
+                print(f"ok   {backend}: {what} match {reference}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
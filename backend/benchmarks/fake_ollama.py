@@ -0,0 +1,60 @@
+"""
+Minimal stand-in for the Ollama HTTP API used by the benchmark suite.
+
+/api/generate echoes the prompt back as its "translation", which keeps the
+[i] element delimiters intact so chunks parse back exactly. Use it
+in-process through httpx.ASGITransport, or as a server:
+
+    FAKE_OLLAMA_LATENCY=0.05 uvicorn benchmarks.fake_ollama:app --port 11435
+"""
+
+import asyncio
+import os
+import time
+
+from fastapi import FastAPI, Request
+
+
+def create_app(latency: float = 0.0) -> FastAPI:
+    """Create a fake Ollama app answering each generate call after `latency` s."""
+    fake = FastAPI(title="Fake Ollama")
+    loaded: set[str] = set()
+
+    @fake.get("/api/tags")
+    async def tags():
+        return {"models": [{"name": "fake:latest"}]}
+
+    @fake.get("/api/ps")
+    async def ps():
+        return {"models": [{"name": name, "model": name} for name in loaded]}
+
+    @fake.post("/api/generate")
+    async def generate(request: Request):
+        started = time.perf_counter_ns()
+        body = await request.json()
+        if latency:
+            await asyncio.sleep(latency)
+
+        if body.get("keep_alive") == 0:
+            loaded.discard(body.get("model", ""))
+        else:
+            loaded.add(body.get("model", ""))
+
+        prompt = body.get("prompt", "")
+        elapsed = time.perf_counter_ns() - started
+        return {
+            "model": body.get("model", ""),
+            "response": prompt,
+            "done": True,
+            "total_duration": elapsed,
+            "load_duration": 0,
+            "prompt_eval_count": len(prompt) // 4,
+            "prompt_eval_duration": elapsed // 2,
+            "eval_count": len(prompt) // 4,
+            "eval_duration": elapsed // 2,
+        }
+
+    return fake
+
+
+app = create_app(latency=float(os.environ.get("FAKE_OLLAMA_LATENCY", "0")))
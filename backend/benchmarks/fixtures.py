@@ -0,0 +1,70 @@
+"""Synthetic EPUB books for the benchmark suite."""
+
+import random
+
+from ebooklib import epub
+
+_WORDS = (
+    "the of and a to in he was that it his her with as had for she not at but "
+    "by on you from they said which be this have or all one were there an so "
+    "would what if their no when up out been into them could more some my time"
+).split()
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(8, 24))]
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(rng: random.Random) -> str:
+    sentences = [_sentence(rng) for _ in range(rng.randint(2, 6))]
+    if rng.random() < 0.3:
+        sentences.insert(1, f"“{_sentence(rng)}” she said.")
+    text = " ".join(sentences)
+    if rng.random() < 0.2:
+        head, _, tail = text.partition(" ")
+        text = f"<em>{head}</em> {tail}"
+    return f"<p>{text}</p>"
+
+
+def make_epub(
+    path: str,
+    chapters: int = 20,
+    paragraphs_per_chapter: int = 200,
+    seed: int = 0,
+) -> str:
+    """Write a deterministic synthetic book to `path` and return the path."""
+    rng = random.Random(seed)
+    book = epub.EpubBook()
+    book.set_identifier(f"benchmark-{seed}")
+    book.set_title("Benchmark Book")
+    book.set_language("en")
+
+    items = []
+    for index in range(chapters):
+        body = "\n".join(_paragraph(rng) for _ in range(paragraphs_per_chapter))
+        item = epub.EpubHtml(
+            title=f"Chapter {index + 1}",
+            file_name=f"chapter_{index + 1}.xhtml",
+            lang="en",
+        )
+        item.content = (
+            f"<html><head><title>Chapter {index + 1}</title></head><body>"
+            f"<h1>Chapter {index + 1}</h1>\n{body}\n"
+            # Nested translatable blocks, common in real books
+            f"<blockquote>{_paragraph(rng)}{_paragraph(rng)}</blockquote>\n"
+            "<ul><li>First note</li>"
+            f"<li>{_paragraph(rng)}{_paragraph(rng)}</li></ul>\n"
+            f"<table><tr><td>{_paragraph(rng)}</td><td>Cell</td></tr></table>\n"
+            f"{_paragraph(rng)}"
+            "</body></html>"
+        )
+        book.add_item(item)
+        items.append(item)
+
+    book.toc = items
+    book.spine = ["nav"] + items
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    epub.write_epub(path, book)
+    return path
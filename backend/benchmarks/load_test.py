@@ -0,0 +1,303 @@
+"""
+Load test for the API with concurrent jobs and WebSocket subscribers.
+
+Starts the fake Ollama backend and the real app as separate uvicorn
+processes, then runs the full upload -> translate -> subscribe/poll ->
+download flow for many jobs at once. Reports API latency percentiles,
+progress message delivery delay, and a timeline of the server's event
+loop lag and memory taken from /api/admin/metrics.
+
+Usage (from backend/):
+    python -m benchmarks.load_test [--jobs 50] [--subscribers 4]
+        [--ollama-latency 0.05] [--json report.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+import httpx
+from websockets.asyncio.client import connect
+
+from app.config import PARSER_BACKEND
+from .fixtures import make_epub
+
+FINISHED = {"completed", "failed", "cancelled"}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _percentiles(values: list[float]) -> dict:
+    if not values:
+        return {"count": 0}
+    values = sorted(values)
+
+    def pick(q: float) -> float:
+        return round(values[min(int(len(values) * q), len(values) - 1)] * 1000, 1)
+
+    return {
+        "count": len(values),
+        "p50_ms": pick(0.50),
+        "p95_ms": pick(0.95),
+        "p99_ms": pick(0.99),
+        "max_ms": round(values[-1] * 1000, 1),
+    }
+
+
+class LoadTest:
+    def __init__(self, base_url: str, args):
+        self.base_url = base_url
+        self.ws_url = base_url.replace("http://", "ws://")
+        self.args = args
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.delivery_delays: list[float] = []
+        self.timeline: list[dict] = []
+        self.errors: list[str] = []
+        self.statuses: dict[str, str] = {}
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=120.0,
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=200),
+        )
+
+    async def _timed(self, name: str, method: str, url: str, **kwargs):
+        start = time.perf_counter()
+        response = await self.client.request(method, url, **kwargs)
+        self.latencies[name].append(time.perf_counter() - start)
+        response.raise_for_status()
+        return response
+
+    async def sample_metrics(self, started: float) -> None:
+        while True:
+            try:
+                response = await self._timed("metrics", "GET", "/api/admin/metrics")
+                data = response.json()
+                rss_bytes = data["rss_bytes"]
+                self.timeline.append(
+                    {
+                        "t": round(time.perf_counter() - started, 1),
+                        "rss_mb": round(rss_bytes / 1024**2, 1)
+                        if rss_bytes is not None
+                        else None,
+                        "loop_lag_max_ms": data["loop_lag"]["max_ms"],
+                        "running_jobs": data["running_jobs"],
+                        "websockets": data["websocket_connections"],
+                    }
+                )
+            except httpx.HTTPError as e:
+                self.errors.append(f"metrics: {e}")
+            await asyncio.sleep(self.args.sample_interval)
+
+    async def subscribe(self, job_id: str) -> None:
+        async with connect(f"{self.ws_url}/ws/progress/{job_id}") as websocket:
+            async for raw in websocket:
+                message = json.loads(raw)
+                if message.get("timestamp"):
+                    self.delivery_delays.append(time.time() - message["timestamp"])
+                if message.get("status") in FINISHED:
+                    return
+
+    async def poll(self, job_id: str) -> str:
+        while True:
+            response = await self._timed("job_status", "GET", f"/api/job/{job_id}")
+            status = response.json()["status"]
+            if status in FINISHED:
+                return status
+            await asyncio.sleep(self.args.poll_interval)
+
+    async def run_job(self, index: int, book: bytes) -> None:
+        try:
+            response = await self._timed(
+                "upload",
+                "POST",
+                "/api/upload",
+                files={"file": (f"book_{index}.epub", book, "application/epub+zip")},
+            )
+            file_id = response.json()["file_id"]
+
+            response = await self._timed(
+                "translate",
+                "POST",
+                "/api/translate",
+                json={
+                    "file_id": file_id,
+                    "source_language": "English",
+                    "target_language": "Korean",
+                    "model": "fake:latest",
+                },
+            )
+            job_id = response.json()["job_id"]
+
+            subscribers = [
+                asyncio.create_task(self.subscribe(job_id))
+                for _ in range(self.args.subscribers)
+            ]
+            status = await self.poll(job_id)
+            await asyncio.wait_for(asyncio.gather(*subscribers), timeout=30)
+            self.statuses[job_id] = status
+
+            if status == "completed":
+                await self._timed("download", "GET", f"/api/download/{job_id}")
+        except Exception as e:
+            self.errors.append(f"job {index}: {type(e).__name__}: {e}")
+
+    async def run(self, book: bytes) -> None:
+        started = time.perf_counter()
+        sampler = asyncio.create_task(self.sample_metrics(started))
+        try:
+            await asyncio.gather(*(self.run_job(i, book) for i in range(self.args.jobs)))
+        finally:
+            self.elapsed = time.perf_counter() - started
+            sampler.cancel()
+            await self.client.aclose()
+
+    def report(self) -> dict:
+        statuses: dict[str, int] = defaultdict(int)
+        for status in self.statuses.values():
+            statuses[status] += 1
+        rss = [
+            point["rss_mb"] for point in self.timeline if point["rss_mb"] is not None
+        ]
+        return {
+            "jobs": self.args.jobs,
+            "subscribers_per_job": self.args.subscribers,
+            "elapsed_s": round(self.elapsed, 1),
+            "job_statuses": dict(statuses),
+            "latency": {
+                name: _percentiles(values) for name, values in self.latencies.items()
+            },
+            "delivery_delay": _percentiles(self.delivery_delays),
+            "loop_lag_max_ms": max(
+                (point["loop_lag_max_ms"] for point in self.timeline), default=0.0
+            ),
+            "rss_start_mb": rss[0] if rss else None,
+            "rss_end_mb": rss[-1] if rss else None,
+            "rss_peak_mb": max(rss, default=None),
+            "timeline": self.timeline,
+            "errors": self.errors,
+        }
+
+
+def print_report(report: dict) -> None:
+    print(
+        f"{report['jobs']} jobs x {report['subscribers_per_job']} subscribers "
+        f"in {report['elapsed_s']} s: {report['job_statuses']}"
+    )
+    print(f"\n{'request':<14} {'count':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    rows = dict(report["latency"], ws_delivery=report["delivery_delay"])
+    for name, stats in rows.items():
+        if not stats["count"]:
+            continue
+        print(
+            f"{name:<14} {stats['count']:>6} {stats['p50_ms']:>8} "
+            f"{stats['p95_ms']:>8} {stats['p99_ms']:>8} {stats['max_ms']:>8}"
+        )
+
+    print(f"\n{'t s':>6} {'rss MB':>8} {'lag ms':>8} {'jobs':>5} {'ws':>5}")
+    for point in report["timeline"]:
+        print(
+            f"{point['t']:>6} {str(point['rss_mb']):>8} {point['loop_lag_max_ms']:>8} "
+            f"{point['running_jobs']:>5} {point['websockets']:>5}"
+        )
+    print(
+        f"\nmax loop lag {report['loop_lag_max_ms']} ms, RSS "
+        f"{report['rss_start_mb']} -> {report['rss_end_mb']} MB "
+        f"(peak {report['rss_peak_mb']} MB)"
+    )
+    for error in report["errors"][:20]:
+        print(f"error: {error}")
+
+
+def _start_server(app: str, port: int, env: dict) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", app,
+            "--port", str(port), "--log-level", "warning",
+        ],
+        env=env,
+    )
+
+
+async def _wait_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while True:
+            try:
+                (await client.get(url)).raise_for_status()
+                return
+            except httpx.HTTPError:
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.2)
+
+
+async def main_async(args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        book_path = make_epub(
+            os.path.join(tmp, "book.epub"), args.chapters, args.paragraphs
+        )
+        with open(book_path, "rb") as f:
+            book = f.read()
+
+        ollama_port, api_port = _free_port(), _free_port()
+        env = dict(
+            os.environ,
+            FAKE_OLLAMA_LATENCY=str(args.ollama_latency),
+            OLLAMA_BASE_URL=f"http://127.0.0.1:{ollama_port}",
+            EPUB_UPLOAD_DIR=os.path.join(tmp, "uploads"),
+            EPUB_OUTPUT_DIR=os.path.join(tmp, "outputs"),
+            EPUB_PARSER_BACKEND=args.parser_backend,
+            # BeautifulSoup warns about XHTML on every chapter
+            PYTHONWARNINGS="ignore",
+        )
+        servers = [
+            _start_server("benchmarks.fake_ollama:app", ollama_port, env),
+            _start_server("app.main:app", api_port, env),
+        ]
+        try:
+            base_url = f"http://127.0.0.1:{api_port}"
+            await _wait_ready(f"http://127.0.0.1:{ollama_port}/api/tags")
+            await _wait_ready(f"{base_url}/api/languages")
+
+            load_test = LoadTest(base_url, args)
+            await load_test.run(book)
+            return load_test.report()
+        finally:
+            for server in servers:
+                server.terminate()
+                server.wait()
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--jobs", type=int, default=50)
+    arg_parser.add_argument("--subscribers", type=int, default=4)
+    arg_parser.add_argument("--poll-interval", type=float, default=1.0)
+    arg_parser.add_argument("--ollama-latency", type=float, default=0.05)
+    arg_parser.add_argument("--chapters", type=int, default=3)
+    arg_parser.add_argument("--paragraphs", type=int, default=40)
+    arg_parser.add_argument("--sample-interval", type=float, default=1.0)
+    arg_parser.add_argument("--parser-backend", default=PARSER_BACKEND)
+    arg_parser.add_argument("--json", help="also write the report to this file")
+    args = arg_parser.parse_args()
+
+    report = asyncio.run(main_async(args))
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -23,11 +23,13 @@ export interface TranslateParams {
 	source_language: string;
 	target_language: string;
 	model: string;
+	glossary?: Record<string, string>;
 }
 
 export interface ProgressMessage {
 	type: string;
 	job_id: string;
+	timestamp?: number;
 	status: string;
 	chapter_current: number;
 	chapter_total: number;
@@ -38,6 +40,8 @@ export interface ProgressMessage {
 	estimated_time_remaining: number;
 	preview_original: string;
 	preview_translated: string;
+	model_load_time?: number | null;
+	translation_time?: number;
 	error_message?: string;
 	download_url?: string;
 }